@@ -1,13 +1,22 @@
 """Fermi Calculator - Textual UI Application"""
+import threading
+from itertools import chain
+from typing import Optional
+from textual import work
 from textual.app import App, ComposeResult
+from textual.timer import Timer
+from textual.worker import get_current_worker
 from textual.widgets import TextArea, Static, Header, Footer, Button
 from textual.containers import Horizontal, Vertical
 import numpy as np
-from fermi_engine import FermiEngine
+from fermi_engine import FermiEngine, DEFAULT_CACHE_DIR
 from fermi_formatter import format_number, format_distribution
 
 __version__ = "0.1.0"
 
+# Delay before a requested calculation runs, so bursts of requests run once
+CALC_DEBOUNCE_SECONDS = 0.15
+
 class FermiApp(App):
     """A Fermi estimation calculator with two-panel UI"""
     
@@ -19,7 +28,11 @@ class FermiApp(App):
     
     def __init__(self):
         super().__init__()
-        self.engine = FermiEngine()
+        self.engine = FermiEngine(cache_dir=DEFAULT_CACHE_DIR)
+        # One (line, result, variables snapshot) entry per line of the last run
+        self._line_cache: list = []
+        self._engine_lock = threading.Lock()  # Serializes background calculations
+        self._calc_timer: Optional[Timer] = None  # Pending debounced calculation
     
     def compose(self) -> ComposeResult:
         """Create the UI layout"""
@@ -40,23 +53,86 @@ class FermiApp(App):
             self.action_calculate()
     
     def action_calculate(self) -> None:
-        """Execute the model and display results"""
-        # Get input text
+        """Schedule a calculation, coalescing rapid repeated requests"""
+        if self._calc_timer is not None:
+            self._calc_timer.stop()
+        self._calc_timer = self.set_timer(CALC_DEBOUNCE_SECONDS, self._start_calculation)
+    
+    def _start_calculation(self) -> None:
+        """Hand the current input text to a background calculation"""
+        self._calc_timer = None
+        
+        # Widgets are only touched on the UI thread; the worker gets the
+        # input text and the output widget handed over
         input_widget = self.query_one("#input", TextArea)
-        text = input_widget.text
+        output_widget = self.query_one("#output", Static)
+        self._run_calc(input_widget.text, output_widget)
+    
+    @work(exclusive=True, thread=True)
+    def _run_calc(self, text: str, output_widget: Static) -> None:
+        """Execute the model and display results, off the UI thread"""
+        # A superseded worker may still be running; never share the engine
+        with self._engine_lock:
+            if get_current_worker().is_cancelled:
+                return
+            
+            # Execute model, reusing results for unchanged leading lines
+            results = self.execute_incremental(text)
+            
+            # Format output
+            output_text = self.format_results(text, results)
+        
+        # Display, unless a newer calculation has started meanwhile
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(output_widget.update, output_text)
+    
+    def execute_incremental(self, text: str) -> list:
+        """
+        Execute the model, re-running only the lines from the first edit on.
+        
+        Lines are evaluated top to bottom, so an unchanged prefix always sees
+        the same variables and its cached results and variable snapshot can
+        be reused as-is. Everything after the first changed line is executed.
+        """
+        lines = text.split("\n")
         
-        # Clear engine variables for fresh calculation
+        # Count leading lines identical to the previous run
+        reused = 0
+        for line, (cached_line, _, _) in zip(lines, self._line_cache):
+            if line != cached_line:
+                break
+            reused += 1
+        
+        # Restore engine state as it was after the last reused line
         self.engine.clear()
         
-        # Execute model
-        results = self.engine.execute_model(text)
+        if not reused:
+            # Full run: execute_model can answer from the engine's disk cache.
+            # Only assignments change variables, so snapshots can be rebuilt
+            # from the results alone.
+            results = self.engine.execute_model(text)
+            line_cache = []
+            variables = {}
+            for line, result in zip(lines, results):
+                if result["type"] == "assignment":
+                    variables[result["var"]] = result["value"]
+                line_cache.append((line, result, dict(variables)))
+            
+            self._line_cache = line_cache
+            return results
         
-        # Format output
-        output_text = self.format_results(text, results)
+        self.engine.variables.update(self._line_cache[reused - 1][2])
         
-        # Display
-        output_widget = self.query_one("#output", Static)
-        output_widget.update(output_text)
+        line_cache = self._line_cache[:reused]
+        results = [entry[1] for entry in line_cache]
+        
+        for line in lines[reused:]:
+            result = self.engine.execute_line(line)
+            results.append(result)
+            line_cache.append((line, result, dict(self.engine.variables)))
+        
+        self._line_cache = line_cache
+        return results
     
     def format_results(self, input_text: str, results: list) -> str:
         """
@@ -64,28 +140,30 @@ class FermiApp(App):
         Handles both scalars and distributions.
         """
         input_lines = input_text.split("\n")
-        output_lines = []
         
-        for line, result in zip(input_lines, results):
-            # Add the input line
-            output_lines.append(line)
-            
-            # Add the result on the next line with =>
-            if result["type"] == "assignment":
-                value = result["value"]
-                
-                # Check if value is array (distribution) or scalar
-                if isinstance(value, np.ndarray):
-                    formatted_value = format_distribution(value)
-                else:
-                    formatted_value = format_number(value)
-                
-                output_lines.append(f"=> {formatted_value}")
-            
-            elif result["type"] == "error":
-                output_lines.append(f"=> ERROR: {result['message']}")
+        # Each input line is followed by its "=> ..." line, if it has one
+        output_lines = chain.from_iterable(
+            (line,) if formatted is None else (line, formatted)
+            for line, formatted in zip(input_lines, map(self._format_result, results))
+        )
         
         return "\n".join(output_lines)
+    
+    @staticmethod
+    def _format_result(result: dict) -> Optional[str]:
+        """Format one result as an "=> ..." line, or None if it has no output"""
+        if result["type"] == "assignment":
+            value = result["value"]
+            
+            # Check if value is array (distribution) or scalar
+            if isinstance(value, np.ndarray):
+                return f"=> {format_distribution(value)}"
+            return f"=> {format_number(value)}"
+        
+        elif result["type"] == "error":
+            return f"=> ERROR: {result['message']}"
+        
+        return None
 
 
 def main():
@@ -1,21 +1,243 @@
 """Core evaluation engine for Fermi Calculator"""
-from typing import Dict, List, Any, Union
+import ast
+import hashlib
+import math
+import pickle
+from pathlib import Path
+from types import CodeType
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple, Union
 import numpy as np
-from fermi_parser import parse_line, tokenize, ParseError
+
+from fermi_parser import ParsedLine, parse_line, tokenize, tokenize_all, to_postfix, ParseError, BINARY_OPERATORS, TK
 from fermi_formatter import format_number
+from fermi_kernels import JIT_AVAILABLE, ARRAY_KERNELS, get_kernel
+
+
+# Python AST node types for compiling scalar expressions
+AST_OPERATORS = {
+    '+': ast.Add,
+    '-': ast.Sub,
+    '*': ast.Mult,
+    '/': ast.Div,
+}
+
+# In-place capable equivalents used when an operand is a temporary array
+ARRAY_OPERATORS = {
+    '+': np.add,
+    '-': np.subtract,
+    '*': np.multiply,
+    '/': np.divide,
+}
+
+# Uniform deviates are drawn this many sample-sets at a time
+RNG_BATCH_FACTOR = 10
+
+# Upper bound on parsed lines, and on compiled expressions, kept by FermiEngine
+MAX_CACHED_LINES = 4096
+
+# Upper bound on idle temporaries kept by FermiEngine for reuse
+MAX_SCRATCH_BUFFERS = 4
+
+# Monte Carlo sample size per distribution
+DEFAULT_NUM_SAMPLES = 100000
+
+# Default location for FermiEngine's persistent model cache
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "fermi"
+
+# Part of every disk cache key; bump whenever the results a model produces
+# (or their pickled form) change, so older entries are never served
+CACHE_FORMAT_VERSION = 2
+
+# Most model results kept in the disk cache; the oldest are deleted first
+MAX_CACHE_FILES = 64
+
+# Globals for evaluating compiled scalar expressions: no builtins, shared
+# across calls so eval() does not need a fresh dict each time
+_EVAL_GLOBALS = {"__builtins__": {}}
+
+
+class _LazyUniform:
+    """Uniform distribution whose samples have not been drawn yet"""
+    __slots__ = ("min_val", "max_val")
+    
+    def __init__(self, min_val: float, max_val: float):
+        self.min_val = min_val
+        self.max_val = max_val
+
+
+def _lower(postfix: List[tuple]) -> Tuple[tuple, ...]:
+    """Replace the string tags of postfix tokens with integer TK tags"""
+    return tuple((int(TK[token[0]]),) + tuple(token[1:]) for token in postfix)
+
+
+def _combine_uniform(op: str, left: Any, right: Any) -> Optional[_LazyUniform]:
+    """
+    Apply an operator to a lazy uniform and a scalar analytically.
+    
+    An affine transform of a uniform distribution is again uniform, so
+    U(a, b) + c, U(a, b) * c, etc. only need new bounds. Returns None when
+    the result is not a uniform (e.g. U + U, c / U) and samples are needed.
+    """
+    if isinstance(left, _LazyUniform) and isinstance(right, (int, float)):
+        lo, hi, c = left.min_val, left.max_val, right
+        if op == '+':
+            return _LazyUniform(lo + c, hi + c)
+        if op == '-':
+            return _LazyUniform(lo - c, hi - c)
+        if op == '*':
+            return _LazyUniform(lo * c, hi * c) if c >= 0 else _LazyUniform(hi * c, lo * c)
+        if op == '/' and c != 0:
+            return _LazyUniform(lo / c, hi / c) if c > 0 else _LazyUniform(hi / c, lo / c)
+    
+    elif isinstance(right, _LazyUniform) and isinstance(left, (int, float)):
+        c, lo, hi = left, right.min_val, right.max_val
+        if op == '+':
+            return _LazyUniform(c + lo, c + hi)
+        if op == '-':
+            return _LazyUniform(c - hi, c - lo)
+        if op == '*':
+            return _LazyUniform(c * lo, c * hi) if c >= 0 else _LazyUniform(c * hi, c * lo)
+    
+    return None
+
+
+def _exceeds_range(dtype: np.dtype, *scalars: float) -> bool:
+    """True if a floating dtype cannot hold the magnitude of any of scalars"""
+    dtype = np.dtype(dtype)
+    if dtype.kind != "f":
+        return False
+    limit = float(np.finfo(dtype).max)
+    return any(abs(value) > limit for value in scalars)
+
+
+def _compile_scalar(postfix: List[tuple]) -> Optional[CodeType]:
+    """
+    Compile a distribution-free postfix expression to a Python code object.
+    
+    The Python AST is built directly from the postfix tokens, so no source
+    text is generated or re-parsed. Variables become free names resolved
+    against the locals passed to eval(). Returns None if the expression
+    contains UNIFORM tokens, or a name Python cannot compile (e.g. None).
+    """
+    stack = []
+    
+    for token in postfix:
+        token_type = token[0]
+        if token_type == "NUMBER":
+            stack.append(ast.Constant(float(token[1])))
+        elif token_type == "VARIABLE":
+            stack.append(ast.Name(token[1], ast.Load()))
+        elif token_type == "OPERATOR":
+            right = stack.pop()
+            left = stack.pop()
+            stack.append(ast.BinOp(left, AST_OPERATORS[token[1]](), right))
+        elif token_type == "NEGATE":
+            stack.append(ast.UnaryOp(ast.USub(), stack.pop()))
+        else:
+            return None
+    
+    tree = ast.fix_missing_locations(ast.Expression(stack.pop()))
+    try:
+        return compile(tree, "<fermi>", "eval")
+    except (SyntaxError, ValueError):
+        return None
 
 
 class FermiEngine:
     """Engine for evaluating Fermi calculator expressions"""
     
-    def __init__(self):
-        """Initialize the engine with empty variable storage"""
+    def __init__(self, cache_dir: Optional[Path] = None, dtype: Any = np.float32,
+                 num_samples: int = DEFAULT_NUM_SAMPLES):
+        """
+        Initialize the engine with empty variable storage.
+        
+        Args:
+            cache_dir: Directory for persisting execute_model results across
+                sessions (e.g. DEFAULT_CACHE_DIR); None disables the disk cache
+            dtype: Floating-point type of distribution samples; float32 is
+                ample for order-of-magnitude estimates. Bounds and scalar
+                factors beyond its range are widened to float64, but the
+                product of two float32 distributions can still overflow to
+                inf, so pass np.float64 for models reaching ~1e38
+            num_samples: Samples drawn per distribution
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self.variables: Dict[str, Union[float, np.ndarray]] = {}
-        self.num_samples = 100000  # Monte Carlo sample size
+        self.num_samples = num_samples  # Monte Carlo sample size
+        self.rng = np.random.default_rng()
+        self.dtype = dtype  # Sample precision
+        self._u01: Optional[np.ndarray] = None  # Batch of U(0, 1) deviates
+        self._u01_pos = 0  # Next unused index in _u01
+        self.use_qmc = False  # Stratified (1-D quasi-random) sampling
+        # Opt-in Numba kernels for array expressions (needs numba): compiling a
+        # new expression shape costs far more than evaluating it with NumPy,
+        # so this only pays off for expressions evaluated many times
+        self.use_jit = False
+        self._code_cache: Dict[str, Optional[CodeType]] = {}  # expr -> code (None if not scalar)
+        self._postfix_cache: Dict[str, List[tuple]] = {}  # expr -> postfix tokens
+        self._program_cache: Dict[str, Tuple[tuple, ...]] = {}  # expr -> TK-tagged postfix
+        self._stochastic_exprs: Set[str] = set()  # exprs containing a distribution literal
+        self._ast_cache: Dict[str, ParsedLine] = {}  # raw line -> parsed line
+        self._parsed_model: Optional[Tuple[str, List[ParsedLine]]] = None  # last (text, parsed lines)
+        self._scratch_pool: List[np.ndarray] = []  # Dead temporaries, reused as ufunc outputs
+        self._expr_cache: Optional[Dict[tuple, tuple]] = None  # Per-execute_model CSE results
+    
+    def seed(self, seed: Optional[int]):
+        """
+        Reseed the engine's random generator, for reproducible samples.
+        
+        Args:
+            seed: Seed for a fresh PCG64 generator; None reseeds from the OS
+        """
+        self.rng = np.random.default_rng(seed)
+        self._u01 = None  # Drop deviates drawn from the previous generator
+        self._u01_pos = 0
     
     def _sample_uniform(self, min_val: float, max_val: float) -> np.ndarray:
         """Generate uniform samples between min and max"""
-        return np.random.uniform(min_val, max_val, self.num_samples)
+        n = self.num_samples
+        u = self._next_uniforms(n)
+        scale = max_val - min_val
+        dtype = np.dtype(self.dtype)
+        if _exceeds_range(dtype, min_val, max_val, scale):
+            # Past e.g. float32's ~3.4e38 the samples would all be inf
+            dtype = np.dtype(np.float64)
+            scale = np.float64(scale)  # Forces a float64 multiply below
+        out = self._get_scratch((n,), dtype)
+        
+        if self.use_qmc:
+            # One point per equal-width stratum, shuffled so that independent
+            # distributions are not correlated sample-by-sample; the division
+            # by n is folded into the affine scale below
+            np.add(u, np.arange(n, dtype=self.dtype), out=out)
+            self.rng.shuffle(out)
+            u = out
+            scale /= n
+        
+        # Affine map [0, 1) -> [min, max): one multiply and one add, both
+        # written into out, so no temporaries and the out dtype is kept
+        np.multiply(u, scale, out=out)
+        out += min_val
+        return out
+    
+    def _next_uniforms(self, n: int) -> np.ndarray:
+        """
+        Return a view of the next n standard uniform deviates from a batch
+        buffer, refilling the whole buffer with one RNG call when exhausted.
+        The view is only valid until the next call.
+        """
+        buf = self._u01
+        if buf is None or buf.dtype != self.dtype or len(buf) < n:
+            buf = self._u01 = np.empty(n * RNG_BATCH_FACTOR, dtype=self.dtype)
+            self._u01_pos = len(buf)
+        
+        if self._u01_pos + n > len(buf):
+            self.rng.random(out=buf, dtype=buf.dtype)
+            self._u01_pos = 0
+        
+        start = self._u01_pos
+        self._u01_pos += n
+        return buf[start:start + n]
     
     def evaluate_expression(self, expr: str) -> Union[float, np.ndarray]:
         """
@@ -43,77 +265,384 @@ class FermiEngine:
             >>> isinstance(result, np.ndarray)
             True
         """
-        # Tokenize the expression
-        tokens = tokenize(expr)
+        # Postfix form only depends on the source text, so reuse it across runs
+        postfix = self._postfix_cache.get(expr)
+        if postfix is None:
+            postfix = self._compile_expression(expr, tokenize(expr))
+        
+        # Literal-only expressions were folded to one NUMBER by to_postfix
+        if len(postfix) == 1 and postfix[0][0] == "NUMBER":
+            return postfix[0][1]
+        
+        # Expressions with a distribution literal were tagged at compile time
+        stochastic = expr in self._stochastic_exprs
+        
+        # Within execute_model, identical deterministic expressions over the
+        # same variable values are computed once; stochastic ones never are,
+        # so that each occurrence is an independent draw
+        key = None
+        if self._expr_cache is not None and not stochastic:
+            key = self._subexpression_key(postfix)
+            if key is not None:
+                cached = self._expr_cache.get(key)
+                if cached is not None:
+                    return cached[1]
+        
+        result = self._evaluate_postfix(expr, postfix, stochastic)
+        
+        if key is not None:
+            # Keep the operand values alive so their id()s cannot be reused
+            operands = tuple(self.variables[t[1]] for t in postfix if t[0] == "VARIABLE")
+            self._expr_cache[key] = (operands, result)
+        
+        return result
+    
+    def _subexpression_key(self, postfix: List[tuple]) -> Optional[tuple]:
+        """
+        Cache key for a deterministic postfix expression and the current
+        values of its variables, or None if it cannot be evaluated
+        (undefined variable).
+        """
+        ids = []
+        tokens = []
+        for token in postfix:
+            if token[0] == "VARIABLE":
+                value = self.variables.get(token[1])
+                if value is None:
+                    return None
+                ids.append(id(value))
+            elif token[0] == "NUMBER":
+                # 0.0 == -0.0, so key the sign too or x * -0 reuses x * 0
+                token = token + (math.copysign(1.0, token[1]),)
+            tokens.append(token)
+        return (tuple(tokens), tuple(ids))
+    
+    def _evaluate_postfix(self, expr: str, postfix: List[tuple],
+                          stochastic: bool) -> Union[float, np.ndarray]:
+        """Evaluate a compiled expression with the fastest applicable evaluator"""
+        # Deterministic expressions over scalars run as cached CPython
+        # bytecode; stochastic ones always produce arrays, so skip straight
+        # to the array evaluators
+        if not stochastic:
+            code = self._code_cache[expr]
+            if code is not None:
+                result = self._evaluate_code(code)
+                if result is not None:
+                    return result
+        
+        # use_jit is only a request; without numba it is ignored
+        if self.use_jit and JIT_AVAILABLE:
+            result = self._evaluate_fused(postfix)
+            if result is not None:
+                return result
         
+        return self._evaluate_tokens(self._program_cache[expr])
+    
+    def _compile_expression(self, expr: str, tokens: List[tuple]) -> List[tuple]:
+        """Convert tokens to postfix and cache the compiled forms for expr"""
         if not tokens:
             raise ParseError("Empty expression")
         
-        # Convert tokens to evaluable form
-        return self._evaluate_tokens(tokens)
+        postfix = to_postfix(tokens)
+        
+        # Like _parse_cached, start over when full; the compiled forms are
+        # always dropped together so they stay consistent with each other
+        if len(self._postfix_cache) >= MAX_CACHED_LINES:
+            self._postfix_cache.clear()
+            self._program_cache.clear()
+            self._code_cache.clear()
+            self._stochastic_exprs.clear()
+        
+        self._postfix_cache[expr] = postfix
+        self._program_cache[expr] = _lower(postfix)
+        self._code_cache[expr] = _compile_scalar(postfix)
+        if any(token[0] == "UNIFORM" for token in postfix):
+            self._stochastic_exprs.add(expr)
+        return postfix
     
-    def _evaluate_tokens(self, tokens: List[tuple]) -> Union[float, np.ndarray]:
+    def _evaluate_code(self, code: CodeType) -> Optional[float]:
         """
-        Evaluate a list of tokens using operator precedence.
+        Evaluate a compiled scalar expression against the variables.
         
-        Handles: +, -, *, /, parentheses, and UNIFORM distributions
-        Strategy:
-        - UNIFORM tokens → generate numpy arrays
-        - NUMBER tokens → stay as floats
-        - VARIABLE tokens → look up (can be float or array)
-        - Operations work element-wise when arrays involved
+        Returns None if any referenced variable holds a distribution, so the
+        array-aware evaluators can handle it instead.
         """
-        expr_parts = []
+        for var_name in code.co_names:
+            if var_name not in self.variables:
+                raise NameError(f"Undefined variable: {var_name}")
+            if isinstance(self.variables[var_name], np.ndarray):
+                return None
         
-        for token in tokens:
+        try:
+            return float(eval(code, _EVAL_GLOBALS, self.variables))
+        except Exception as e:
+            raise ParseError(f"Evaluation error: {e}")
+    
+    def _evaluate_fused(self, postfix: List[tuple]) -> Optional[np.ndarray]:
+        """
+        Evaluate a distribution expression in a single JIT-compiled loop.
+        
+        Returns None when the expression is not worth fusing (fewer than two
+        operations, or no array operands) or cannot be fused (array operands
+        of different shapes), leaving it to _evaluate_tokens.
+        """
+        structure = []
+        operands = []
+        previous = None
+        vector = []  # Per pending subexpression: does it involve an array?
+        
+        for token in postfix:
             token_type = token[0]
             
             if token_type == "NUMBER":
-                value = token[1]
-                expr_parts.append(str(value))
-            
-            elif token_type == "UNIFORM":
-                min_val, max_val = token[1], token[2]
-                samples = self._sample_uniform(min_val, max_val)
-                # Store array in a temp variable for eval
-                var_name = f"_dist_{len(expr_parts)}"
-                self.variables[var_name] = samples
-                expr_parts.append(var_name)
+                structure.append("LEAF")
+                operands.append(token[1])
+                vector.append(False)
             
             elif token_type == "VARIABLE":
                 var_name = token[1]
                 if var_name not in self.variables:
                     raise NameError(f"Undefined variable: {var_name}")
-                expr_parts.append(var_name)
+                structure.append("LEAF")
+                operands.append(self.variables[var_name])
+                vector.append(isinstance(operands[-1], np.ndarray))
+            
+            elif token_type == "UNIFORM":
+                structure.append("LEAF")
+                operands.append(token)  # Sampled below, once fusing is certain
+                vector.append(True)
             
             elif token_type == "OPERATOR":
-                expr_parts.append(token[1])
+                right_vector = vector.pop()
+                left_vector = vector.pop()
+                vector.append(left_vector or right_vector)
+                
+                if (token[1] == "/" and left_vector
+                        and previous[0] == "NUMBER" and previous[1] != 0):
+                    # Array by literal: multiply by its reciprocal instead
+                    operands[-1] = 1.0 / previous[1]
+                    structure.append("*")
+                else:
+                    structure.append(token[1])
             
-            elif token_type == "LPAREN":
-                expr_parts.append("(")
+            elif token_type == "NEGATE":
+                structure.append("NEGATE")
             
-            elif token_type == "RPAREN":
-                expr_parts.append(")")
+            previous = token
+        
+        if len(structure) - len(operands) < 2:
+            return None
         
-        expr_string = "".join(expr_parts)
+        # The kernel indexes every array operand up to len(out) unchecked,
+        # so only fuse when all arrays (and fresh samples) share one 1-D shape
+        shapes = {value.shape for value in operands if isinstance(value, np.ndarray)}
+        if any(isinstance(value, tuple) for value in operands):
+            shapes.add((self.num_samples,))
+        if len(shapes) != 1 or len(next(iter(shapes))) != 1:
+            return None
+        
+        # Worst-case scaling the known scalars and uniform bounds can apply;
+        # unlike the stack evaluator, no lazy-uniform folding happens first
+        magnitude = 1.0
+        for value in operands:
+            if not isinstance(value, np.ndarray):
+                for bound in (value[1:] if isinstance(value, tuple) else (value,)):
+                    if bound:
+                        magnitude *= max(abs(bound), 1.0 / abs(bound))
+        
+        sampled = []  # Temporaries that are dead once the kernel has run
+        for i, value in enumerate(operands):
+            if isinstance(value, tuple):
+                operands[i] = self._sample_uniform(value[1], value[2])
+                sampled.append(operands[i])
+            elif not isinstance(value, np.ndarray):
+                operands[i] = float(value)
+        
+        # Kernels are specialized on which operands are arrays vs scalars
+        kinds = tuple("a" if isinstance(value, np.ndarray) else "s" for value in operands)
+        kernel = get_kernel(tuple(structure), kinds)
+        
+        dtype = np.result_type(*operands)
+        if _exceeds_range(dtype, magnitude):
+            dtype = np.dtype(np.float64)  # Scalars are float64 inside the kernel
+        out = self._get_scratch(shapes.pop(), dtype)
+        kernel(out, *operands)
+        
+        for arr in sampled:
+            self._release_scratch(arr)
+        return out
+    
+    def _evaluate_tokens(self, program: Tuple[tuple, ...]) -> Union[float, np.ndarray]:
+        """
+        Evaluate a lowered postfix program (see _lower) with a value stack.
+        
+        Handles: +, -, *, /, unary minus, and UNIFORM distributions
+        Strategy:
+        - UNIFORM tokens → lazy bounds, sampled at the first non-affine op
+        - NUMBER tokens → stay as floats
+        - VARIABLE tokens → look up (can be float or array)
+        - Operations work element-wise when arrays involved
+        
+        Each instruction's integer TK tag indexes straight into _HANDLERS.
+        """
+        stack = []
+        # Parallel to stack: True for arrays created during this evaluation,
+        # which no variable refers to and can therefore be overwritten
+        owned = []
+        handlers = self._HANDLERS
         
-        # Evaluate using Python's eval (safe because we control the tokens)
         try:
-            # Eval with access to variables (including temp distribution arrays)
-            result = eval(expr_string, {"__builtins__": {}}, self.variables)
-            
-            # Clean up temporary distribution variables
-            temp_vars = [k for k in self.variables.keys() if k.startswith("_dist_")]
-            for k in temp_vars:
-                del self.variables[k]
+            for instruction in program:
+                handlers[instruction[0]](self, stack, owned, instruction)
             
-            if isinstance(result, np.ndarray):
-                return result
-            else:
-                return float(result)
+            result = stack.pop()
+            if isinstance(result, _LazyUniform):
+                result = self._sample_uniform(result.min_val, result.max_val)
         
+        except NameError:
+            raise
         except Exception as e:
             raise ParseError(f"Evaluation error: {e}")
+        
+        if isinstance(result, np.ndarray):
+            return result
+        else:
+            return float(result)
+    
+    def _handle_number(self, stack: list, owned: list, instruction: tuple):
+        """Push a literal"""
+        stack.append(instruction[1])
+        owned.append(False)
+    
+    def _handle_variable(self, stack: list, owned: list, instruction: tuple):
+        """Push a variable's value, raising NameError if it is undefined"""
+        var_name = instruction[1]
+        if var_name not in self.variables:
+            raise NameError(f"Undefined variable: {var_name}")
+        stack.append(self.variables[var_name])
+        owned.append(False)
+    
+    def _handle_operator(self, stack: list, owned: list, instruction: tuple):
+        """Pop two operands and push the result of a binary operator"""
+        op = instruction[1]
+        right = stack.pop()
+        right_owned = owned.pop()
+        left = stack.pop()
+        left_owned = owned.pop()
+        
+        if isinstance(left, _LazyUniform) or isinstance(right, _LazyUniform):
+            # Keep uniform-with-scalar arithmetic in closed form
+            value = _combine_uniform(op, left, right)
+            if value is not None:
+                stack.append(value)
+                owned.append(False)
+                return
+            
+            # Not closed-form: draw the samples now
+            if isinstance(left, _LazyUniform):
+                left = self._sample_uniform(left.min_val, left.max_val)
+                left_owned = True
+            if isinstance(right, _LazyUniform):
+                right = self._sample_uniform(right.min_val, right.max_val)
+                right_owned = True
+        
+        if (op == "/" and isinstance(left, np.ndarray)
+                and not isinstance(right, np.ndarray) and right != 0):
+            # Array by scalar: one multiply per element is cheaper than a divide
+            op = "*"
+            right = 1.0 / right
+        
+        if isinstance(left, np.ndarray) != isinstance(right, np.ndarray):
+            array, scalar = (left, right) if isinstance(left, np.ndarray) else (right, left)
+            if _exceeds_range(array.dtype, scalar):
+                # The scalar is out of the array dtype's range (e.g. float32):
+                # compute in float64 rather than overflow to inf
+                if left is scalar:
+                    left = np.float64(left)
+                else:
+                    right = np.float64(right)
+                out = self._get_scratch(array.shape, np.dtype(np.float64))
+                stack.append(ARRAY_OPERATORS[op](left, right, out=out))
+                owned.append(True)
+                if left_owned or right_owned:
+                    self._release_scratch(array)
+                return
+        
+        if not (isinstance(left, np.ndarray) or isinstance(right, np.ndarray)):
+            stack.append(BINARY_OPERATORS[op](left, right))
+            owned.append(False)
+            return
+        
+        # Reuse a temporary as the output buffer instead of allocating a new
+        # array for every element-wise op, but only if it can hold the result
+        # (a float32 temporary must not receive a float64 result)
+        dtype = np.result_type(left, right)
+        shape = np.broadcast_shapes(np.shape(left), np.shape(right))
+        if left_owned and left.dtype == dtype and left.shape == shape:
+            out = left
+        elif right_owned and right.dtype == dtype and right.shape == shape:
+            out = right
+        else:
+            out = self._get_scratch(shape, dtype)
+        
+        stack.append(self._array_op(op, left, right, out))
+        owned.append(True)
+        if left_owned and left is not out:
+            self._release_scratch(left)
+        if right_owned and right is not out:
+            self._release_scratch(right)
+    
+    def _array_op(self, op: str, left: Any, right: Any, out: np.ndarray) -> np.ndarray:
+        """Apply an element-wise operator into out, via a JIT kernel if possible"""
+        kernel = ARRAY_KERNELS.get(op) if self.use_jit and JIT_AVAILABLE else None
+        if (kernel is not None and isinstance(left, np.ndarray) and isinstance(right, np.ndarray)
+                and left.shape == right.shape == out.shape):
+            kernel(left, right, out)
+            return out
+        return ARRAY_OPERATORS[op](left, right, out=out)
+    
+    def _handle_negate(self, stack: list, owned: list, instruction: tuple):
+        """Negate the top of the stack"""
+        value = stack.pop()
+        if isinstance(value, _LazyUniform):
+            stack.append(_LazyUniform(-value.max_val, -value.min_val))
+        elif owned[-1]:
+            stack.append(np.negative(value, out=value))
+        elif isinstance(value, np.ndarray):
+            stack.append(np.negative(value, out=self._get_scratch(value.shape, value.dtype)))
+            owned[-1] = True
+        else:
+            stack.append(-value)
+    
+    def _handle_uniform(self, stack: list, owned: list, instruction: tuple):
+        """Push an unsampled uniform distribution"""
+        # Sampling is deferred until a non-affine operation
+        stack.append(_LazyUniform(instruction[1], instruction[2]))
+        owned.append(False)
+    
+    # Indexed by TK value; parentheses never reach postfix programs
+    _HANDLERS = (
+        _handle_number,    # TK.NUMBER
+        _handle_variable,  # TK.VARIABLE
+        _handle_operator,  # TK.OPERATOR
+        None,              # TK.LPAREN
+        None,              # TK.RPAREN
+        _handle_uniform,   # TK.UNIFORM
+        _handle_negate,    # TK.NEGATE
+    )
+    
+    def _get_scratch(self, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """Take a buffer of the given shape and dtype from the pool, or allocate one"""
+        pool = self._scratch_pool
+        for i in range(len(pool) - 1, -1, -1):
+            if pool[i].shape == shape and pool[i].dtype == dtype:
+                return pool.pop(i)
+        return np.empty(shape, dtype=dtype)
+    
+    def _release_scratch(self, arr: np.ndarray):
+        """Return a dead temporary to the scratch pool for later reuse"""
+        if len(self._scratch_pool) < MAX_SCRATCH_BUFFERS:
+            self._scratch_pool.append(arr)
     
     def execute_line(self, line: str) -> Dict[str, Any]:
         """
@@ -137,18 +666,26 @@ class FermiEngine:
             >>> engine.variables["x"]
             10.0
         """
+        # Blank lines skip the parse cache and dispatch entirely
+        if not line or line.isspace():
+            return {"type": "empty"}
+        return self._execute_parsed(self._parse_cached(line))
+    
+    def _execute_parsed(self, parsed: ParsedLine) -> Dict[str, Any]:
+        """Execute one already-parsed line (see execute_line)"""
         try:
-            parsed = parse_line(line)
+            if parsed.type == "comment":
+                return {"type": "comment", "text": parsed.text}
             
-            if parsed["type"] == "comment":
-                return {"type": "comment", "text": parsed["text"]}
-            
-            elif parsed["type"] == "empty":
+            elif parsed.type == "empty":
                 return {"type": "empty"}
             
-            elif parsed["type"] == "assignment":
-                var_name = parsed["var"]
-                expr = parsed["expr"]
+            elif parsed.type == "error":
+                return {"type": "error", "message": parsed.message}
+            
+            elif parsed.type == "assignment":
+                var_name = parsed.var
+                expr = parsed.expr
                 
                 # Evaluate the expression (returns float or np.ndarray)
                 value = self.evaluate_expression(expr)
@@ -163,19 +700,108 @@ class FermiEngine:
                 }
                 
                 # Include comment if present
-                if "comment" in parsed:
-                    result["comment"] = parsed["comment"]
+                if parsed.comment is not None:
+                    result["comment"] = parsed.comment
                 
                 return result
             
             else:
-                return {"type": "error", "message": f"Unknown line type: {parsed['type']}"}
+                return {"type": "error", "message": f"Unknown line type: {parsed.type}"}
         
         except (ParseError, NameError) as e:
             return {"type": "error", "message": str(e)}
         except Exception as e:
             return {"type": "error", "message": f"Unexpected error: {e}"}
     
+    def _parse_cached(self, line: str) -> ParsedLine:
+        """
+        _parse_or_error with a per-engine cache keyed by the raw line.
+        
+        Parsed lines never bind variable values, so entries stay valid for
+        the engine's lifetime; the cache is simply emptied when it fills up.
+        """
+        parsed = self._ast_cache.get(line)
+        if parsed is None:
+            if len(self._ast_cache) >= MAX_CACHED_LINES:
+                self._ast_cache.clear()
+            parsed = self._ast_cache[line] = self._parse_or_error(line)
+        return parsed
+    
+    @staticmethod
+    def _parse_or_error(line: str) -> ParsedLine:
+        """parse_line, with a ParseError turned into an error entry"""
+        try:
+            return parse_line(line)
+        except ParseError as e:
+            return ParsedLine("error", message=str(e))
+    
+    def _parse_model(self, text: str) -> List[ParsedLine]:
+        """
+        Parse every line of a model, reusing the previous parse if the text
+        is unchanged. Lines that fail to parse become error entries.
+        """
+        if self._parsed_model is not None and self._parsed_model[0] == text:
+            return self._parsed_model[1]
+        
+        # split("\n") rather than splitlines() keeps one result per input line,
+        # including a trailing empty line, as format_results expects
+        parsed_lines = [self._parse_cached(line) for line in text.split("\n")]
+        
+        # Tokenize all new expressions in one pass to prime the compile caches
+        exprs = [
+            parsed.expr for parsed in parsed_lines
+            if parsed.type == "assignment" and parsed.expr not in self._postfix_cache
+        ]
+        if exprs:
+            try:
+                token_lines = tokenize_all("\n".join(exprs))
+            except ParseError:
+                # Leave it to evaluate_expression to report the failing line
+                token_lines = []
+            
+            for expr, tokens in zip(exprs, token_lines):
+                try:
+                    self._compile_expression(expr, tokens)
+                except ParseError:
+                    pass  # Re-raised for this line when it is evaluated
+        
+        self._parsed_model = (text, parsed_lines)
+        return parsed_lines
+    
+    def compile_model(self, text: str) -> Callable[[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Parse and compile a model once, for repeated evaluation.
+        
+        Args:
+            text: Multi-line model text
+        
+        Returns:
+            A function taking a variables dict and returning the list of
+            line results, as execute_model would. Assignments are stored
+            into the dict it is given.
+        
+        Examples:
+            >>> engine = FermiEngine()
+            >>> run = engine.compile_model("y = x * 2")
+            >>> run({"x": 10.0})[0]["value"]
+            20.0
+            >>> run({"x": 3.0})[0]["value"]
+            6.0
+        """
+        parsed_lines = self._parse_model(text)
+        
+        def run(variables: Dict[str, Any]) -> List[Dict[str, Any]]:
+            saved_variables = self.variables
+            self.variables = variables
+            self._expr_cache = {}
+            try:
+                return [self._execute_parsed(parsed) for parsed in parsed_lines]
+            finally:
+                self._expr_cache = None
+                self.variables = saved_variables
+        
+        return run
+    
     def execute_model(self, text: str) -> List[Dict[str, Any]]:
         """
         Execute entire model, return list of results.
@@ -196,15 +822,86 @@ class FermiEngine:
             >>> results[1]["value"]
             20.0
         """
-        lines = text.split("\n")
-        results = []
+        # Cached results are only valid for a run that starts from scratch
+        cache_path = self._cache_path(text) if not self.variables else None
+        if cache_path is not None:
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                results, variables = cached
+                self.variables.update(variables)
+                return results
+        
+        results = self.compile_model(text)(self.variables)
         
-        for line in lines:
-            result = self.execute_line(line)
-            results.append(result)
+        if cache_path is not None:
+            self._store_cached(cache_path, results)
         
         return results
     
+    def _cache_path(self, text: str) -> Optional[Path]:
+        """Disk cache file for a model text, or None if caching is disabled"""
+        if self.cache_dir is None:
+            return None
+        
+        key = hashlib.sha1(text.encode()).hexdigest()[:16]
+        mode = "_qmc" if self.use_qmc else ""
+        return self.cache_dir / (
+            f"v{CACHE_FORMAT_VERSION}_{key}_{self.num_samples}_{np.dtype(self.dtype).name}{mode}.pkl"
+        )
+    
+    @staticmethod
+    def _load_cached(path: Path) -> Optional[Tuple[list, dict]]:
+        """Load (results, variables) from the disk cache; None on a miss"""
+        try:
+            with open(path, "rb") as f:
+                results, variables = pickle.load(f)
+            path.touch()  # Mark as recently used for _prune_cache
+        except Exception:
+            # Missing, truncated, or written by an incompatible build
+            return None
+        
+        if not isinstance(results, list) or not isinstance(variables, dict):
+            return None
+        return results, variables
+    
+    def _store_cached(self, path: Path, results: List[Dict[str, Any]]):
+        """Write (results, variables) to the disk cache, ignoring I/O errors"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump((results, self.variables), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            return  # The cache is only an optimization
+        
+        self._prune_cache()
+    
+    def _prune_cache(self):
+        """Delete the least recently used cache files beyond MAX_CACHE_FILES"""
+        entries = []
+        for path in self.cache_dir.glob("*.pkl"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                pass
+        
+        entries.sort()
+        for _, path in entries[:-MAX_CACHE_FILES]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+    
+    def clear_cache(self):
+        """Delete all persisted execute_model results"""
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return
+        
+        for path in self.cache_dir.glob("*.pkl"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+    
     def clear(self):
         """Clear all stored variables"""
         self.variables.clear()
\ No newline at end of file
@@ -1,7 +1,29 @@
 """Number formatting utilities for Fermi Calculator"""
+import math
+from functools import lru_cache
+from typing import List, Tuple
 import numpy as np
 
 
+# Multipliers for number suffixes (either case)
+SUFFIX_MULTIPLIERS = {
+    'K': 1e3, 'k': 1e3,
+    'M': 1e6, 'm': 1e6,
+    'B': 1e9, 'b': 1e9,
+}
+
+# Display suffixes, one per power of 1000
+_SUFFIXES = ('', 'K', 'M', 'B')
+_DIVISORS = (1.0, 1e3, 1e6, 1e9)
+_SUFFIXES_ARRAY = np.array(_SUFFIXES)
+_FORMAT_TABLE = tuple((d, f"%.2f{suffix}") for d, suffix in zip(_DIVISORS, _SUFFIXES))
+_SMALL_FORMATS = ("%.0f", "%.2f")
+_DIVISORS_ARRAY = np.array(_DIVISORS)
+
+# Quantiles reported by format_distribution (P10, P50, P90)
+_QUANTILES = np.array([0.1, 0.5, 0.9])
+
+
 def parse_number(s: str) -> float:
     """
     Parse a string with K/M/B suffixes into a float.
@@ -22,41 +44,27 @@ def parse_number(s: str) -> float:
         ValueError: If string cannot be parsed
     """
     s = s.strip()
-    
     if not s:
         raise ValueError("Empty string cannot be parsed as a number")
     
-    # Define suffix multipliers
-    suffixes = {
-        'K': 1e3,
-        'M': 1e6,
-        'B': 1e9,
-    }
-    
-    # Check if string ends with a suffix
-    if s[-1].upper() in suffixes:
-        suffix = s[-1].upper()
-        number_part = s[:-1].strip()
-        
-        if not number_part:
-            raise ValueError(f"Invalid number format: {s}")
-        
-        try:
-            value = float(number_part)
-            return value * suffixes[suffix]
-        except ValueError:
-            raise ValueError(f"Invalid number format: {s}")
-    
-    # No suffix, parse as plain number
+    # A suffix can only be the last character
+    multiplier = SUFFIX_MULTIPLIERS.get(s[-1])
+    mantissa = s[:-1].rstrip() if multiplier else s
+    
+    if not mantissa:
+        raise ValueError(f"Invalid number format: {s}")
     try:
-        return float(s)
+        value = float(mantissa)
     except ValueError:
-        raise ValueError(f"Invalid number format: {s}")
+        raise ValueError(f"Invalid number format: {s}") from None
+    
+    return value * multiplier if multiplier else value
 
 
 def format_number(n: float) -> str:
     """
-    Format a number with appropriate K/M/B suffix.
+    Format a number with appropriate K/M/B suffix. Results are cached, as
+    the same values are formatted again on every redraw.
     
     Examples:
         format_number(2700000) -> "2.70M"
@@ -69,21 +77,69 @@ def format_number(n: float) -> str:
     Returns:
         Formatted string with suffix if appropriate
     """
+    # -0.0 == 0.0 with equal hashes, but they format differently ("-0" vs "0")
+    return _format_number_cached(n, math.copysign(1.0, n))
+
+
+@lru_cache(maxsize=4096)
+def _format_number_cached(n: float, sign: float) -> str:
+    """Cached body of format_number; sign only separates -0.0 from 0.0"""
     abs_n = abs(n)
+    idx = _suffix_index(abs_n)
     
-    # Determine appropriate suffix
+    # Small numbers have no suffix; decimals only below 10 (and not for 0)
+    divisor, fmt = _FORMAT_TABLE[idx] if idx else (1.0, _SMALL_FORMATS[bool(abs_n < 10 and n != 0)])
+    return fmt % (n / divisor)
+
+
+def _suffix_index(abs_n: float) -> int:
+    """Index into _SUFFIXES/_DIVISORS for a non-negative magnitude"""
+    if not abs_n >= 1e3:  # Also catches nan
+        return 0
     if abs_n >= 1e9:
-        return f"{n/1e9:.2f}B"
-    elif abs_n >= 1e6:
-        return f"{n/1e6:.2f}M"
-    elif abs_n >= 1e3:
-        return f"{n/1e3:.2f}K"
-    else:
-        # For small numbers, show without suffix
-        if abs_n >= 10 or n == 0:
-            return f"{n:.0f}"
-        else:
-            return f"{n:.2f}"
+        return 3  # Also catches inf
+    # 1e3 <= abs_n < 1e9: one suffix step per three decades
+    idx = int(math.log10(abs_n)) // 3
+    # Guard against log10 rounding just below a power of 1000
+    if abs_n < _DIVISORS[idx]:
+        idx -= 1
+    return idx
+
+
+def format_number_array(values: np.ndarray) -> List[str]:
+    """
+    Vectorized format_number: format every element of an array.
+    
+    Suffix selection and scaling are done with NumPy in one pass; the
+    result matches calling format_number on each element.
+    
+    Args:
+        values: Array (or sequence) of numbers
+    
+    Returns:
+        List of formatted strings, one per element
+    
+    Examples:
+        format_number_array(np.array([100, 2.5e3, 3e6])) -> ["100", "2.50K", "3.00M"]
+    """
+    a = np.asarray(values, dtype=float)
+    abs_a = np.abs(a)
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponents = np.floor(np.log10(abs_a) / 3)
+    idx = np.clip(np.nan_to_num(exponents, nan=0, neginf=0, posinf=3), 0, 3).astype(int)
+    # Guard against log10 rounding just below a power of 1000
+    idx -= (abs_a < _DIVISORS_ARRAY[idx]) & (idx > 0)
+    
+    scaled = a / _DIVISORS_ARRAY[idx]
+    no_decimals = (idx == 0) & ((abs_a >= 10) | (a == 0))
+    
+    formatted = np.where(
+        no_decimals,
+        np.char.mod("%.0f", scaled),
+        np.char.mod("%.2f", scaled),
+    )
+    return np.char.add(formatted, _SUFFIXES_ARRAY[idx]).tolist()
 
 
 def format_distribution(arr: np.ndarray) -> str:
@@ -101,5 +157,15 @@ def format_distribution(arr: np.ndarray) -> str:
         >>> format_distribution(samples)
         "2.00M 2.50M 3.00M (P10, P50, P90)"
     """
-    p10, p50, p90 = np.percentile(arr, [10, 50, 90])
-    return f"{format_number(p10)} {format_number(p50)} {format_number(p90)} (P10, P50, P90)"
\ No newline at end of file
+    # One call partitions the samples once for all three quantiles
+    percentiles = np.quantile(arr, _QUANTILES)
+    return _format_percentiles(tuple(percentiles.tolist()))
+
+
+@lru_cache(maxsize=1024)
+def _format_percentiles(percentiles: Tuple[float, float, float]) -> str:
+    """
+    Cached tail of format_distribution. Keyed on the exact percentile
+    values: rounding the key could straddle a display rounding boundary.
+    """
+    return f"{' '.join(format_number_array(percentiles))} (P10, P50, P90)"
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Parser for Fermi Calculator expressions"""
-import re
-from typing import Dict, List, Tuple, Any
+import operator
+from enum import IntEnum
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple, Any
 
 
 class ParseError(Exception):
@@ -8,7 +10,75 @@ class ParseError(Exception):
     pass
 
 
-def parse_line(line: str) -> Dict[str, Any]:
+class TK(IntEnum):
+    """Integer token kinds, for dispatch tables indexed by token type"""
+    NUMBER = 0
+    VARIABLE = 1
+    OPERATOR = 2
+    LPAREN = 3
+    RPAREN = 4
+    UNIFORM = 5
+    NEGATE = 6
+
+
+class ParsedLine(NamedTuple):
+    """
+    One parsed input line. Fields that do not apply to the line's type are
+    None. Instances are immutable, so parse_line can share them between
+    calls, and support parsed["field"] lookups and "field" in parsed
+    checks as the dict results of earlier versions did.
+    """
+    type: str
+    var: Optional[str] = None
+    expr: Optional[str] = None
+    comment: Optional[str] = None
+    text: Optional[str] = None
+    message: Optional[str] = None
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            value = getattr(self, key) if key in self._fields else None
+            if value is None:
+                raise KeyError(key)
+            return value
+        return tuple.__getitem__(self, key)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._fields and getattr(self, key) is not None
+
+
+# Shared result for every blank line
+EMPTY_LINE = ParsedLine("empty")
+
+
+# Binary operator precedence (all left-associative)
+PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2}
+
+# Binary operator implementations, shared with the engine's evaluator
+BINARY_OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+
+# Unary minus binds tighter than any binary operator
+UNARY_PRECEDENCE = 3
+
+# Token types that push a value in postfix order
+_OPERAND_TYPES = frozenset({"NUMBER", "UNIFORM", "VARIABLE"})
+
+# Character classes for the tokenizer's scanner
+_DIGITS = frozenset("0123456789")
+_NAME_START = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_")
+_OPERATORS = frozenset(PRECEDENCE)
+
+# Number suffixes accepted in expressions (uppercase only, so a lowercase
+# letter after a number starts a variable name)
+_SUFFIX_MULTIPLIERS = {'K': 1e3, 'M': 1e6, 'B': 1e9}
+
+
+def parse_line(line: str) -> ParsedLine:
     """
     Parse a single line into structured data.
     
@@ -16,33 +86,40 @@ def parse_line(line: str) -> Dict[str, Any]:
         line: A single line of input text
     
     Returns:
-        Dictionary with:
-        - {"type": "comment", "text": "..."} for comments
-        - {"type": "assignment", "var": "x", "expr": "10 * 2"} for assignments
-        - {"type": "empty"} for blank lines
+        ParsedLine with:
+        - type "comment" and text for comments
+        - type "assignment", var, expr (and comment, if any) for assignments
+        - type "empty" for blank lines
     
     Raises:
         ParseError: If line has invalid syntax
     
     Examples:
         >>> parse_line("# comment")
-        {'type': 'comment', 'text': ' comment'}
+        ParsedLine(type='comment', var=None, expr=None, comment=None, text=' comment', message=None)
         
-        >>> parse_line("x = 10")
-        {'type': 'assignment', 'var': 'x', 'expr': '10'}
+        >>> parse_line("x = 10")["expr"]
+        '10'
         
-        >>> parse_line("")
-        {'type': 'empty'}
+        >>> parse_line("").type
+        'empty'
     """
-    line = line.rstrip()  # Remove trailing whitespace
-    
-    # Empty line
+    # Blank lines need no parsing and no cache slot
     if not line or line.isspace():
-        return {"type": "empty"}
+        return EMPTY_LINE
+    return _parse_line_cached(line)
+
+
+@lru_cache(maxsize=4096)
+def _parse_line_cached(line: str) -> ParsedLine:
+    """Cached body of parse_line, for lines that are not blank"""
+    stripped = line.strip()
     
     # Comment line
-    if line.strip().startswith("#"):
-        return {"type": "comment", "text": line.strip()[1:]}
+    if stripped[0] == "#":
+        return ParsedLine("comment", text=stripped[1:])
+    
+    line = line.rstrip()  # Remove trailing whitespace
     
     # Assignment: variable = expression
     if "=" in line:
@@ -73,13 +150,9 @@ def parse_line(line: str) -> Dict[str, Any]:
         if "#" in expr:
             expr_parts = expr.split("#", 1)
             expr = expr_parts[0].strip()
-            comment = expr_parts[1].strip()
-        
-        result = {"type": "assignment", "var": var_name, "expr": expr}
-        if comment:
-            result["comment"] = comment
+            comment = expr_parts[1].strip() or None
         
-        return result
+        return ParsedLine("assignment", var=var_name, expr=expr, comment=comment)
     
     # If we get here, it's an invalid line
     raise ParseError(f"Invalid syntax: {line}")
@@ -111,59 +184,100 @@ def tokenize(expr: str) -> List[Tuple[str, Any]]:
         >>> tokenize("2M 3M")
         [('UNIFORM', 2000000.0, 3000000.0)]
     """
-    from fermi_formatter import parse_number
+    return list(_tokenize_cached(expr))
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_cached(expr: str) -> Tuple[Tuple[Any, ...], ...]:
+    """Cached body of tokenize; returns an immutable tuple of tokens"""
+    return _merge_uniforms([token for line in _scan_lines(expr) for token in line])
+
+
+def tokenize_all(text: str) -> List[List[Tuple[str, Any]]]:
+    """
+    Tokenize a multi-line string of expressions in a single scanning pass.
+    
+    Args:
+        text: Expressions separated by newlines
+    
+    Returns:
+        One token list per line, each as tokenize() would return it
     
+    Raises:
+        ParseError: If any line fails to tokenize
+    
+    Examples:
+        >>> tokenize_all("10 * 2\n2M 3M")
+        [[('NUMBER', 10.0), ('OPERATOR', '*'), ('NUMBER', 2.0)], [('UNIFORM', 2000000.0, 3000000.0)]]
+    """
+    return [list(_merge_uniforms(line)) for line in _scan_lines(text)]
+
+
+def _scan_lines(text: str) -> List[List[Tuple[str, Any]]]:
+    """
+    Scan text in a single character-driven pass, returning raw tokens
+    grouped by line. Numbers (with optional K/M/B suffix) are recognised
+    by their leading digit, so they can never be mistaken for names.
+    """
     tokens = []
+    lines = [tokens]
     i = 0
+    n = len(text)
     
-    while i < len(expr):
-        # Skip whitespace
-        if expr[i].isspace():
+    while i < n:
+        ch = text[i]
+        
+        if ch in _DIGITS:
+            # Mantissa: digits, at most one '.', then more digits
+            start = i
             i += 1
-            continue
-        
-        # Try to match a number (with optional K/M/B suffix)
-        match = re.match(r'^\d+\.?\d*[KMB]?', expr[i:])
-        if match:
-            num_str = match.group()
-            try:
-                value = parse_number(num_str)
-                tokens.append(("NUMBER", value))
-                i += len(num_str)
-                continue
-            except ValueError:
-                raise ParseError(f"Invalid number format: {num_str}")
-        
-        # Try to match a variable
-        match = re.match(r'^[a-zA-Z_]\w*', expr[i:])
-        if match:
-            var_name = match.group()
-            tokens.append(("VARIABLE", var_name))
-            i += len(var_name)
-            continue
-        
-        # Check for single-character tokens
-        char = expr[i]
-        
-        if char in ['+', '-', '*', '/']:
-            tokens.append(("OPERATOR", char))
+            while i < n and text[i] in _DIGITS:
+                i += 1
+            if i < n and text[i] == ".":
+                i += 1
+                while i < n and text[i] in _DIGITS:
+                    i += 1
+            value = float(text[start:i])
+            if i < n and text[i] in _SUFFIX_MULTIPLIERS:
+                value *= _SUFFIX_MULTIPLIERS[text[i]]
+                i += 1
+            tokens.append(("NUMBER", value))
+        
+        elif ch in _NAME_START:
+            start = i
+            i += 1
+            while i < n and (text[i].isalnum() or text[i] == "_"):
+                i += 1
+            tokens.append(("VARIABLE", text[start:i]))
+        
+        elif ch in _OPERATORS:
+            tokens.append(("OPERATOR", ch))
             i += 1
-            continue
         
-        if char == '(':
+        elif ch == "(":
             tokens.append(("LPAREN", "("))
             i += 1
-            continue
         
-        if char == ')':
+        elif ch == ")":
             tokens.append(("RPAREN", ")"))
             i += 1
-            continue
         
-        # If we get here, it's an invalid character
-        raise ParseError(f"Invalid character in expression: '{char}'")
+        elif ch == "\n":
+            tokens = []
+            lines.append(tokens)
+            i += 1
+        
+        elif ch.isspace():
+            i += 1
+        
+        else:
+            raise ParseError(f"Invalid character in expression: '{ch}'")
     
-    # Post-process: Convert consecutive NUMBER tokens into UNIFORM tokens
+    return lines
+
+
+def _merge_uniforms(tokens: List[Tuple[str, Any]]) -> Tuple[Tuple[Any, ...], ...]:
+    """Convert consecutive NUMBER tokens into UNIFORM tokens"""
     processed_tokens = []
     i = 0
     while i < len(tokens):
@@ -187,4 +301,116 @@ def tokenize(expr: str) -> List[Tuple[str, Any]]:
             processed_tokens.append(token)
             i += 1
     
-    return processed_tokens
\ No newline at end of file
+    return tuple(processed_tokens)
+
+
+def to_postfix(tokens: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+    """
+    Convert infix tokens to postfix (Reverse Polish) order using Shunting-Yard.
+    
+    Args:
+        tokens: Token list as returned by tokenize()
+    
+    Returns:
+        List of tokens in postfix order. Operands (NUMBER, UNIFORM, VARIABLE)
+        and binary ("OPERATOR", op) tokens are passed through unchanged;
+        a leading or prefix minus becomes ("NEGATE", "-") and a prefix plus
+        is dropped. Parentheses never appear in the output. Operations
+        whose operands are all NUMBER tokens are folded into one NUMBER.
+    
+    Raises:
+        ParseError: If parentheses are unbalanced or operands/operators
+            are out of place
+    
+    Examples:
+        >>> to_postfix(tokenize("x + y * 2"))
+        [('VARIABLE', 'x'), ('VARIABLE', 'y'), ('NUMBER', 2.0), ('OPERATOR', '*'), ('OPERATOR', '+')]
+        
+        >>> to_postfix(tokenize("-x"))
+        [('VARIABLE', 'x'), ('NEGATE', '-')]
+        
+        >>> to_postfix(tokenize("(2 + 3) * x"))
+        [('NUMBER', 5.0), ('VARIABLE', 'x'), ('OPERATOR', '*')]
+    """
+    output = []
+    stack = []  # Pending operators and left parentheses
+    expect_operand = True
+    
+    for token in tokens:
+        token_type = token[0]
+        
+        if token_type in _OPERAND_TYPES:
+            if not expect_operand:
+                raise ParseError(f"Unexpected operand: {token[1]}")
+            output.append(token)
+            expect_operand = False
+        
+        elif token_type == "OPERATOR":
+            op = token[1]
+            
+            if expect_operand:
+                # Prefix operator: only sign changes are allowed
+                if op == "-":
+                    stack.append(("NEGATE", "-"))
+                elif op != "+":
+                    raise ParseError(f"Unexpected operator: {op}")
+                continue
+            
+            prec = PRECEDENCE[op]
+            while stack and stack[-1][0] != "LPAREN":
+                top = stack[-1]
+                top_prec = UNARY_PRECEDENCE if top[0] == "NEGATE" else PRECEDENCE[top[1]]
+                if top_prec < prec:
+                    break
+                _emit(output, stack.pop())
+            stack.append(token)
+            expect_operand = True
+        
+        elif token_type == "LPAREN":
+            if not expect_operand:
+                raise ParseError("Unexpected '('")
+            stack.append(token)
+        
+        elif token_type == "RPAREN":
+            if expect_operand:
+                raise ParseError("Unexpected ')'")
+            while stack and stack[-1][0] != "LPAREN":
+                _emit(output, stack.pop())
+            if not stack:
+                raise ParseError("Mismatched parentheses: unexpected ')'")
+            stack.pop()  # Discard the matching '('
+        
+        else:
+            raise ParseError(f"Unknown token type: {token_type}")
+    
+    if expect_operand:
+        raise ParseError("Incomplete expression")
+    
+    while stack:
+        token = stack.pop()
+        if token[0] == "LPAREN":
+            raise ParseError("Mismatched parentheses: missing ')'")
+        _emit(output, token)
+    
+    return output
+
+
+def _emit(output: List[Tuple[str, Any]], op_token: Tuple[str, Any]):
+    """
+    Append an operator to postfix output, folding it if its operands are
+    plain numbers. UNIFORM operands are stochastic and are never folded.
+    """
+    if op_token[0] == "NEGATE":
+        if output and output[-1][0] == "NUMBER":
+            output[-1] = ("NUMBER", -output[-1][1])
+            return
+    
+    elif (len(output) >= 2 and output[-1][0] == "NUMBER" and output[-2][0] == "NUMBER"
+            and not (op_token[1] == "/" and output[-1][1] == 0)):
+        # Division by zero is left for evaluation to report
+        right = output.pop()[1]
+        left = output.pop()[1]
+        output.append(("NUMBER", BINARY_OPERATORS[op_token[1]](left, right)))
+        return
+    
+    output.append(op_token)
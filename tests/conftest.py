@@ -0,0 +1,19 @@
+"""Shared fixtures for the Fermi Calculator tests"""
+import os
+
+import pytest
+
+from fermi_engine import FermiEngine, DEFAULT_NUM_SAMPLES
+
+
+# FERMI_TEST_FAST=1 draws 10x fewer samples per distribution, e.g. for CI;
+# the distribution tests only check bounds, which hold at either size
+TEST_NUM_SAMPLES = 10000 if os.environ.get("FERMI_TEST_FAST") == "1" else DEFAULT_NUM_SAMPLES
+
+
+@pytest.fixture
+def engine():
+    """A seeded engine drawing TEST_NUM_SAMPLES samples per distribution"""
+    engine = FermiEngine(num_samples=TEST_NUM_SAMPLES)
+    engine.seed(42)
+    return engine
@@ -1,7 +1,10 @@
 """Tests for fermi_engine module"""
+import pickle
 import pytest
 import numpy as np
-from fermi_engine import FermiEngine
+from conftest import TEST_NUM_SAMPLES
+from fermi_engine import FermiEngine, CACHE_FORMAT_VERSION
+from fermi_kernels import JIT_AVAILABLE
 from fermi_parser import ParseError
 
 
@@ -47,6 +50,11 @@ class TestEvaluateExpression:
         engine = FermiEngine()
         assert engine.evaluate_expression("(10 + 20) * 2") == 60.0
     
+    def test_evaluate_constant_expression_is_folded(self):
+        engine = FermiEngine()
+        assert engine.evaluate_expression("-(10 + 20) * 2") == -60.0
+        assert engine._postfix_cache["-(10 + 20) * 2"] == [("NUMBER", -60.0)]
+    
     def test_evaluate_undefined_variable_raises_error(self):
         engine = FermiEngine()
         with pytest.raises(NameError):
@@ -55,46 +63,82 @@ class TestEvaluateExpression:
     def test_evaluate_with_suffix(self):
         engine = FermiEngine()
         assert engine.evaluate_expression("2.5K") == 2500.0
+    
+    def test_evaluate_unary_minus(self):
+        engine = FermiEngine()
+        engine.variables["x"] = 10
+        assert engine.evaluate_expression("-x * 2") == -20.0
+        assert engine.evaluate_expression("5 - -3") == 8.0
+    
+    def test_evaluate_left_associative(self):
+        engine = FermiEngine()
+        assert engine.evaluate_expression("100 / 10 / 2") == 5.0
+        assert engine.evaluate_expression("10 - 4 - 3") == 3.0
+    
+    def test_evaluate_division_by_zero_raises_error(self):
+        engine = FermiEngine()
+        with pytest.raises(ParseError):
+            engine.evaluate_expression("10 / 0")
+    
+    def test_evaluate_mismatched_parentheses_raises_error(self):
+        engine = FermiEngine()
+        with pytest.raises(ParseError):
+            engine.evaluate_expression("(10 + 20")
+    
+    def test_evaluate_scalar_then_distribution_variable(self):
+        engine = FermiEngine()
+        engine.variables["x"] = 10.0
+        assert engine.evaluate_expression("x * 2") == 20.0
+        engine.variables["x"] = np.array([1.0, 2.0])
+        assert np.array_equal(engine.evaluate_expression("x * 2"), [2.0, 4.0])
+    
+    def test_evaluate_reuses_postfix_for_new_values(self):
+        engine = FermiEngine()
+        engine.variables["x"] = 10
+        assert engine.evaluate_expression("x * 2") == 20.0
+        engine.variables["x"] = 4
+        assert engine.evaluate_expression("x * 2") == 8.0
+        assert "x * 2" in engine._postfix_cache
 
 
 class TestEvaluateDistributions:
     """Tests for evaluating uniform distributions"""
     
-    def test_evaluate_uniform_distribution(self):
-        np.random.seed(42)
-        engine = FermiEngine()
+    def test_evaluate_uniform_distribution(self, engine):
         result = engine.evaluate_expression("2M 3M")
         
         assert isinstance(result, np.ndarray)
-        assert len(result) == 100000
+        assert len(result) == engine.num_samples
         assert result.min() >= 2e6
         assert result.max() <= 3e6
     
-    def test_evaluate_uniform_simple(self):
-        np.random.seed(42)
+    def test_seed_makes_samples_reproducible(self):
         engine = FermiEngine()
+        engine.seed(7)
+        first = engine.evaluate_expression("10 20").copy()
+        engine.evaluate_expression("10 20")
+        engine.seed(7)
+        assert np.array_equal(engine.evaluate_expression("10 20"), first)
+    
+    def test_evaluate_uniform_simple(self, engine):
         result = engine.evaluate_expression("10 20")
         
         assert isinstance(result, np.ndarray)
-        assert len(result) == 100000
+        assert len(result) == engine.num_samples
         assert result.min() >= 10
         assert result.max() <= 20
     
-    def test_scalar_times_distribution(self):
-        np.random.seed(42)
-        engine = FermiEngine()
+    def test_scalar_times_distribution(self, engine):
         engine.variables["x"] = 10.0
         result = engine.evaluate_expression("x * 5 10")
         
         assert isinstance(result, np.ndarray)
-        assert len(result) == 100000
+        assert len(result) == engine.num_samples
         # Result should be in range 50-100 (10 * 5 to 10 * 10)
         assert result.min() >= 50
         assert result.max() <= 100
     
-    def test_distribution_times_scalar(self):
-        np.random.seed(42)
-        engine = FermiEngine()
+    def test_distribution_times_scalar(self, engine):
         result = engine.evaluate_expression("5 10 * 2")
         
         assert isinstance(result, np.ndarray)
@@ -102,9 +146,7 @@ class TestEvaluateDistributions:
         assert result.min() >= 10
         assert result.max() <= 20
     
-    def test_distribution_arithmetic(self):
-        np.random.seed(42)
-        engine = FermiEngine()
+    def test_distribution_arithmetic(self, engine):
         result = engine.evaluate_expression("10 20 + 5 10")
         
         assert isinstance(result, np.ndarray)
@@ -112,9 +154,7 @@ class TestEvaluateDistributions:
         assert result.min() >= 15
         assert result.max() <= 30
     
-    def test_distribution_subtraction(self):
-        np.random.seed(42)
-        engine = FermiEngine()
+    def test_distribution_subtraction(self, engine):
         result = engine.evaluate_expression("20 30 - 5 10")
         
         assert isinstance(result, np.ndarray)
@@ -122,9 +162,7 @@ class TestEvaluateDistributions:
         assert result.min() >= 10
         assert result.max() <= 25
     
-    def test_distribution_multiplication(self):
-        np.random.seed(42)
-        engine = FermiEngine()
+    def test_distribution_multiplication(self, engine):
         result = engine.evaluate_expression("2 3 * 4 5")
         
         assert isinstance(result, np.ndarray)
@@ -132,15 +170,261 @@ class TestEvaluateDistributions:
         assert result.min() >= 8
         assert result.max() <= 15
     
-    def test_distribution_division(self):
-        np.random.seed(42)
-        engine = FermiEngine()
+    def test_distribution_division(self, engine):
         result = engine.evaluate_expression("20 30 / 2 5")
         
         assert isinstance(result, np.ndarray)
         # Result should be in range 4-15 (20/5 to 30/2)
         assert result.min() >= 4
         assert result.max() <= 15
+    
+    def test_distribution_chain_does_not_modify_variables(self, engine):
+        engine.variables["a"] = engine.rng.uniform(10, 20, engine.num_samples)
+        original = engine.variables["a"].copy()
+        result = engine.evaluate_expression("a * 2 + 5 10 - -a")
+        
+        assert np.array_equal(engine.variables["a"], original)
+        assert result.min() >= 2 * 10 + 5 + 10
+        assert result.max() <= 3 * 20 + 10
+    
+    def test_distribution_times_negative_scalar(self, engine):
+        result = engine.evaluate_expression("-2 * 10 20")
+        
+        assert isinstance(result, np.ndarray)
+        assert result.min() >= -40
+        assert result.max() <= -20
+    
+    def test_distribution_affine_chain(self, engine):
+        engine.variables["x"] = 4.0
+        result = engine.evaluate_expression("(10 20 - 10) / x + 1")
+        
+        assert isinstance(result, np.ndarray)
+        assert len(result) == engine.num_samples
+        assert result.min() >= 1
+        assert result.max() <= 3.5
+    
+    def test_qmc_sampling_is_stratified(self):
+        engine = FermiEngine()
+        engine.dtype = np.float64  # Exact stratum boundaries
+        engine.use_qmc = True
+        engine.num_samples = 1000
+        result = engine.evaluate_expression("10 20")
+        
+        assert len(result) == 1000
+        strata = np.floor((np.sort(result) - 10) / 10 * 1000)
+        assert np.array_equal(strata, np.arange(1000))
+    
+    def test_distribution_leaves_no_temporary_variables(self):
+        engine = FermiEngine()
+        engine.variables["x"] = 2.0
+        engine.evaluate_expression("10 20 + 5 10 * x")
+        
+        assert list(engine.variables) == ["x"]
+    
+    def test_uniform_samples_written_into_pooled_buffer(self):
+        engine = FermiEngine()
+        engine.num_samples = 1000
+        pooled = np.empty(1000, dtype=np.float32)
+        engine._release_scratch(pooled)
+        
+        result = engine.evaluate_expression("10 20")
+        assert result is pooled
+        assert result.min() >= 10
+        assert result.max() <= 20
+    
+    def test_samples_survive_rng_buffer_refill(self):
+        engine = FermiEngine()
+        engine.num_samples = 100
+        first = engine.evaluate_expression("10 20")
+        snapshot = first.copy()
+        
+        # Enough draws to wrap around the batch buffer several times
+        for _ in range(25):
+            other = engine.evaluate_expression("10 20")
+            assert not np.array_equal(other, first)
+        
+        assert np.array_equal(first, snapshot)
+    
+    def test_samples_use_engine_dtype(self, engine):
+        assert engine.evaluate_expression("10 20 * 2 + 1").dtype == np.float32
+        
+        engine.dtype = np.float64
+        assert engine.evaluate_expression("10 20 * 2 + 1").dtype == np.float64
+    
+    def test_distribution_expressions_are_tagged_stochastic(self):
+        engine = FermiEngine()
+        engine.variables["x"] = 2.0
+        engine.evaluate_expression("x * 2")
+        engine.evaluate_expression("x * (1 2)")
+        
+        assert engine._stochastic_exprs == {"x * (1 2)"}
+    
+    def test_magnitudes_beyond_float32_widen_to_float64(self):
+        for use_jit in {False, JIT_AVAILABLE}:
+            engine = FermiEngine(num_samples=1000)
+            engine.use_jit = use_jit
+            engine.variables["x"] = 1e40
+            engine.variables["a"] = engine.evaluate_expression("1 2")
+            engine.variables["d"] = engine.evaluate_expression("1 2 * x")
+            
+            with np.errstate(over="raise"):
+                for expr in ("x * 1 2", "1000B 2000B * 1000B * 1000B * 1000B * 1000B",
+                             "a * x", "a * x + 1", "a / (1 / x) - 1",
+                             "1 2 + d", "d + 1 2", "a * 2 + d"):
+                    result = engine.evaluate_expression(expr)
+                    assert result.dtype == np.float64
+                    assert np.all(np.isfinite(result))
+    
+    def test_compiled_expression_caches_are_capped(self, monkeypatch):
+        import fermi_engine
+        monkeypatch.setattr(fermi_engine, "MAX_CACHED_LINES", 3)
+        engine = FermiEngine(num_samples=10)
+        
+        for i in range(5):
+            engine.evaluate_expression(f"{i} {i + 1}")
+        
+        assert len(engine._postfix_cache) <= 3
+        assert engine._program_cache.keys() == engine._postfix_cache.keys()
+        assert engine._code_cache.keys() == engine._postfix_cache.keys()
+        assert engine._stochastic_exprs <= engine._postfix_cache.keys()
+    
+    def test_dtype_constructor_argument(self):
+        engine = FermiEngine(dtype=np.float64)
+        engine.variables["a"] = engine.evaluate_expression("1 2")
+        assert engine.variables["a"].dtype == np.float64
+        assert engine.evaluate_expression("a * 3 4 - 1").dtype == np.float64
+    
+    def test_dead_temporaries_are_reused(self):
+        engine = FermiEngine()
+        engine.use_jit = False
+        engine.variables["a"] = np.full(1000, 2.0)
+        engine.variables["b"] = np.full(1000, 3.0)
+        
+        engine.evaluate_expression("a * b + a * b")
+        assert len(engine._scratch_pool) == 1
+        pooled = engine._scratch_pool[0]
+        
+        result = engine.evaluate_expression("a + b")
+        assert result is pooled
+        assert np.all(result == 5.0)
+        assert np.all(engine.variables["a"] == 2.0)
+    
+    def test_fused_kernel_releases_sampled_uniforms(self):
+        pytest.importorskip("numba")
+        engine = FermiEngine()
+        engine.use_jit = True
+        engine.num_samples = 1000
+        
+        result = engine.evaluate_expression("1 2 * 3 4 + 5 6")
+        assert len(engine._scratch_pool) == 3
+        assert all(arr is not result for arr in engine._scratch_pool)
+    
+    def test_jit_is_opt_in(self):
+        assert FermiEngine().use_jit is False
+    
+    def test_use_jit_without_numba_falls_back(self, monkeypatch):
+        import fermi_engine
+        import fermi_kernels
+        monkeypatch.setattr(fermi_kernels, "numba", None)
+        monkeypatch.setattr(fermi_kernels, "JIT_AVAILABLE", False)
+        monkeypatch.setattr(fermi_engine, "JIT_AVAILABLE", False)
+        
+        engine = FermiEngine(num_samples=1000)
+        engine.use_jit = True
+        engine.variables["a"] = engine.evaluate_expression("1 2")
+        engine.variables["b"] = engine.evaluate_expression("3 4")
+        product = engine.evaluate_expression("a * b")
+        result = engine.evaluate_expression("a * 2 + b")
+        
+        assert product.min() >= 3
+        assert product.max() <= 8
+        assert result.min() >= 5
+        assert result.max() <= 8
+    
+    def test_use_jit_without_array_kernels_uses_numpy(self, monkeypatch):
+        import fermi_engine
+        monkeypatch.setattr(fermi_engine, "ARRAY_KERNELS", {})
+        
+        engine = FermiEngine(num_samples=1000)
+        engine.use_jit = True
+        engine.variables["a"] = engine.evaluate_expression("1 2")
+        engine.variables["b"] = engine.evaluate_expression("3 4")
+        result = engine.evaluate_expression("a - b")
+        
+        assert result.min() >= -3
+        assert result.max() <= -1
+    
+    def test_division_by_scalar_matches_true_division(self):
+        engine = FermiEngine()
+        engine.variables["a"] = engine.rng.uniform(10, 20, 1000)
+        engine.variables["d"] = 3.0
+        expected = engine.variables["a"] / 3.0
+        
+        for use_jit in {False, JIT_AVAILABLE}:
+            engine.use_jit = use_jit
+            assert np.allclose(engine.evaluate_expression("a / d"), expected)
+            assert np.allclose(engine.evaluate_expression("a / 3 + 1"), expected + 1)
+        
+        with np.errstate(divide="ignore"):
+            assert np.all(np.isinf(engine.evaluate_expression("a / 0")))
+    
+    def test_fused_kernel_rewrites_only_array_division(self, monkeypatch):
+        pytest.importorskip("numba")
+        import fermi_engine
+        structures = []
+        real_get_kernel = fermi_engine.get_kernel
+        
+        def recording_get_kernel(structure, kinds):
+            structures.append(structure)
+            return real_get_kernel(structure, kinds)
+        
+        monkeypatch.setattr(fermi_engine, "get_kernel", recording_get_kernel)
+        engine = FermiEngine()
+        engine.use_jit = True
+        engine.variables["a"] = np.ones(100)
+        engine.variables["x"] = 2.0
+        
+        engine.evaluate_expression("x / 3 * a")
+        engine.evaluate_expression("a / 3 + x")
+        assert structures == [
+            ("LEAF", "LEAF", "/", "LEAF", "*"),
+            ("LEAF", "LEAF", "*", "LEAF", "+"),
+        ]
+    
+    def test_fused_kernel_rejects_mismatched_shapes(self):
+        pytest.importorskip("numba")
+        engine = FermiEngine()
+        engine.use_jit = True
+        engine.num_samples = 1000
+        engine.variables["a"] = np.ones(10)
+        
+        with pytest.raises(ParseError):
+            engine.evaluate_expression("1 2 * 2 + a")
+    
+    def test_fused_kernel_matches_numpy_path(self, engine):
+        pytest.importorskip("numba")
+        engine.variables["a"] = engine.rng.uniform(10, 20, engine.num_samples)
+        engine.variables["b"] = engine.rng.uniform(1, 2, engine.num_samples)
+        
+        engine.use_jit = True
+        fused = engine.evaluate_expression("a * 2 + b / 3 - -a")
+        engine.use_jit = False
+        plain = engine.evaluate_expression("a * 2 + b / 3 - -a")
+        
+        assert np.allclose(fused, plain)
+    
+    def test_array_kernel_matches_numpy_path(self):
+        pytest.importorskip("numba")
+        engine = FermiEngine()
+        engine.variables["a"] = engine.rng.uniform(10, 20, 1000)
+        engine.variables["b"] = engine.rng.uniform(1, 2, 1000)
+        
+        engine.use_jit = True
+        jit = engine.evaluate_expression("a / b")
+        engine.use_jit = False
+        plain = engine.evaluate_expression("a / b")
+        
+        assert np.allclose(jit, plain)
 
 
 class TestExecuteLine:
@@ -196,15 +480,36 @@ class TestExecuteLine:
         result = engine.execute_line("invalid syntax")
         assert result["type"] == "error"
     
-    def test_execute_distribution_assignment(self):
-        np.random.seed(42)
+    def test_execute_errors_return_dicts(self):
         engine = FermiEngine()
+        for line in ("y = zz + 1", "y = 2 $ 3", "y = 2 *", "invalid syntax"):
+            result = engine.execute_line(line)
+            assert type(result) is dict
+            assert result["type"] == "error"
+        
+        results = engine.execute_model("a = 1\nb = q * 2")
+        assert [type(r) for r in results] == [dict, dict]
+    
+    def test_execute_line_repeated_with_new_values(self):
+        engine = FermiEngine()
+        engine.variables["x"] = 1.0
+        assert engine.execute_line("y = x + 1")["value"] == 2.0
+        engine.variables["x"] = 4.0
+        assert engine.execute_line("y = x + 1")["value"] == 5.0
+        assert "y = x + 1" in engine._ast_cache
+    
+    def test_execute_line_repeated_error(self):
+        engine = FermiEngine()
+        assert engine.execute_line("invalid syntax")["type"] == "error"
+        assert engine.execute_line("invalid syntax")["type"] == "error"
+    
+    def test_execute_distribution_assignment(self, engine):
         result = engine.execute_line("x = 2M 3M")
         
         assert result["type"] == "assignment"
         assert result["var"] == "x"
         assert isinstance(result["value"], np.ndarray)
-        assert len(result["value"]) == 100000
+        assert len(result["value"]) == engine.num_samples
 
 
 class TestExecuteModel:
@@ -251,9 +556,7 @@ households = population / people_per_household
         assert engine.variables["y"] == 20.0
         assert engine.variables["z"] == 30.0
     
-    def test_execute_model_with_distributions(self):
-        np.random.seed(42)
-        engine = FermiEngine()
+    def test_execute_model_with_distributions(self, engine):
         text = "a = 10 20\nb = 5 10\nc = a + b"
         results = engine.execute_model(text)
         
@@ -262,9 +565,7 @@ households = population / people_per_household
         assert isinstance(results[1]["value"], np.ndarray)
         assert isinstance(results[2]["value"], np.ndarray)
     
-    def test_execute_model_mixed_scalar_distribution(self):
-        np.random.seed(42)
-        engine = FermiEngine()
+    def test_execute_model_mixed_scalar_distribution(self, engine):
         text = """
 population = 2M 3M
 households = population / 2.5
@@ -280,6 +581,142 @@ households = population / 2.5
         households = results[1]["value"]
         assert households.min() >= 800000
         assert households.max() <= 1200000
+    
+    def test_execute_model_with_parse_error(self):
+        engine = FermiEngine()
+        text = "x = 10\njust some text\ny = x * 2"
+        results = engine.execute_model(text)
+        
+        assert len(results) == 3
+        assert results[1]["type"] == "error"
+        assert results[2]["value"] == 20.0
+    
+    def test_execute_model_with_invalid_expression(self):
+        engine = FermiEngine()
+        text = "x = 10\ny = 3 @ 2\nz = x * 2"
+        results = engine.execute_model(text)
+        
+        assert results[1]["type"] == "error"
+        assert "Invalid character" in results[1]["message"]
+        assert results[2]["value"] == 20.0
+    
+    def test_execute_model_shares_repeated_expressions(self, engine):
+        text = "a = 10 20\nb = a / 2\nc = a/2"
+        results = engine.execute_model(text)
+        
+        assert results[2]["value"] is results[1]["value"]
+    
+    def test_execute_model_keeps_sign_of_zero_literals(self):
+        engine = FermiEngine()
+        text = "x = 5\na = x * 0\nb = x * -0"
+        results = engine.execute_model(text)
+        
+        assert np.copysign(1.0, results[1]["value"]) == 1.0
+        assert np.copysign(1.0, results[2]["value"]) == -1.0
+    
+    def test_execute_model_repeated_distributions_are_independent(self, engine):
+        text = "a = 10 20\nb = 10 20"
+        results = engine.execute_model(text)
+        
+        assert not np.array_equal(results[0]["value"], results[1]["value"])
+    
+    def test_execute_model_repeated_expression_after_reassignment(self):
+        engine = FermiEngine()
+        text = "x = 1\ny = x * 2\nx = 5\nz = x * 2"
+        results = engine.execute_model(text)
+        
+        assert results[1]["value"] == 2.0
+        assert results[3]["value"] == 10.0
+    
+    def test_execute_model_rerun_uses_new_values(self):
+        engine = FermiEngine()
+        text = "y = x * 2"
+        engine.variables["x"] = 10
+        assert engine.execute_model(text)[0]["value"] == 20.0
+        engine.variables["x"] = 3
+        assert engine.execute_model(text)[0]["value"] == 6.0
+    
+    def test_compile_model_runs_against_given_variables(self):
+        engine = FermiEngine()
+        run = engine.compile_model("y = x * 2\nz = y + 1")
+        
+        scenario_a = {"x": 10.0}
+        scenario_b = {"x": 3.0}
+        assert [r["value"] for r in run(scenario_a)] == [20.0, 21.0]
+        assert [r["value"] for r in run(scenario_b)] == [6.0, 7.0]
+        
+        # Assignments land in the given dict, not the engine's own
+        assert scenario_a["z"] == 21.0
+        assert scenario_b["z"] == 7.0
+        assert engine.variables == {}
+
+
+class TestDiskCache:
+    """Tests for the persistent execute_model cache"""
+    
+    def test_cache_hit_returns_same_samples(self, tmp_path):
+        text = "a = 10 20\nb = a * 2"
+        first = FermiEngine(cache_dir=tmp_path, num_samples=TEST_NUM_SAMPLES).execute_model(text)
+        
+        engine = FermiEngine(cache_dir=tmp_path, num_samples=TEST_NUM_SAMPLES)
+        second = engine.execute_model(text)
+        
+        assert np.array_equal(first[1]["value"], second[1]["value"])
+        assert np.array_equal(engine.variables["b"], second[1]["value"])
+    
+    def test_cache_keyed_by_sample_count(self, tmp_path):
+        FermiEngine(cache_dir=tmp_path, num_samples=TEST_NUM_SAMPLES).execute_model("a = 10 20")
+        
+        engine = FermiEngine(cache_dir=tmp_path, num_samples=TEST_NUM_SAMPLES)
+        engine.num_samples = 1000
+        results = engine.execute_model("a = 10 20")
+        
+        assert len(results[0]["value"]) == 1000
+    
+    def test_cache_skipped_with_existing_variables(self, tmp_path):
+        FermiEngine(cache_dir=tmp_path, num_samples=TEST_NUM_SAMPLES).execute_model("y = x * 2")
+        
+        engine = FermiEngine(cache_dir=tmp_path, num_samples=TEST_NUM_SAMPLES)
+        engine.variables["x"] = 5.0
+        results = engine.execute_model("y = x * 2")
+        
+        assert results[0]["value"] == 10.0
+    
+    def test_clear_cache_removes_files(self, tmp_path):
+        engine = FermiEngine(cache_dir=tmp_path, num_samples=TEST_NUM_SAMPLES)
+        engine.execute_model("x = 10")
+        assert list(tmp_path.glob("*.pkl"))
+        
+        engine.clear_cache()
+        assert not list(tmp_path.glob("*.pkl"))
+    
+    def test_corrupt_cache_file_is_a_miss(self, tmp_path):
+        engine = FermiEngine(cache_dir=tmp_path, num_samples=TEST_NUM_SAMPLES)
+        path = engine._cache_path("x = 10")
+        
+        for payload in (b"not a pickle", pickle.dumps(5), b"\x80\x04\x95"):
+            path.write_bytes(payload)
+            engine.clear()
+            assert engine.execute_model("x = 10")[0]["value"] == 10.0
+    
+    def test_cache_key_includes_format_version(self, tmp_path):
+        engine = FermiEngine(cache_dir=tmp_path, num_samples=TEST_NUM_SAMPLES)
+        assert engine._cache_path("x = 10").name.startswith(f"v{CACHE_FORMAT_VERSION}_")
+    
+    def test_cache_directory_is_capped(self, tmp_path, monkeypatch):
+        import fermi_engine
+        monkeypatch.setattr(fermi_engine, "MAX_CACHE_FILES", 3)
+        engine = FermiEngine(cache_dir=tmp_path, num_samples=TEST_NUM_SAMPLES)
+        
+        for i in range(5):
+            engine.clear()
+            engine.execute_model(f"x = {i}")
+        
+        assert len(list(tmp_path.glob("*.pkl"))) == 3
+        assert engine._cache_path("x = 4").exists()
+    
+    def test_no_cache_dir_by_default(self):
+        assert FermiEngine().cache_dir is None
 
 
 class TestClear:
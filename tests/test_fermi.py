@@ -0,0 +1,58 @@
+"""Tests for fermi module"""
+import pytest
+import numpy as np
+from fermi import FermiApp
+
+
+@pytest.fixture
+def app():
+    """An app whose engine does not touch the on-disk result cache"""
+    app = FermiApp()
+    app.engine.cache_dir = None
+    return app
+
+
+class TestExecuteIncremental:
+    """Tests for execute_incremental method"""
+    
+    def test_unchanged_prefix_is_reused(self, app):
+        first = app.execute_incremental("a = 10 20\nb = a * 2")
+        second = app.execute_incremental("a = 10 20\nb = a * 3")
+        
+        # The distribution is not re-sampled; only the edited line runs
+        assert second[0] is first[0]
+        assert np.allclose(second[1]["value"], first[0]["value"] * 3)
+    
+    def test_edited_middle_line_reruns_dependents(self, app):
+        first = app.execute_incremental("x = 1\ny = 2\nz = x + y")
+        second = app.execute_incremental("x = 1\ny = 5\nz = x + y")
+        
+        assert second[0] is first[0]
+        assert second[1]["value"] == 5.0
+        assert second[2]["value"] == 6.0
+        assert app.engine.variables == {"x": 1.0, "y": 5.0, "z": 6.0}
+    
+    def test_shrinking_text_drops_trailing_lines(self, app):
+        app.execute_incremental("x = 1\ny = 2\nz = 3")
+        results = app.execute_incremental("x = 1\ny = 2")
+        
+        assert [r["value"] for r in results] == [1.0, 2.0]
+        assert len(app._line_cache) == 2
+        assert "z" not in app.engine.variables
+    
+    def test_full_run_rebuilds_snapshots(self, app):
+        app.execute_incremental("# header\nx = 1\n\ny = x * 2")
+        
+        snapshots = [entry[2] for entry in app._line_cache]
+        assert snapshots == [{}, {"x": 1.0}, {"x": 1.0}, {"x": 1.0, "y": 2.0}]
+        
+        # A later edit restarts from the rebuilt snapshot of the line above
+        results = app.execute_incremental("# header\nx = 1\n\ny = x * 3")
+        assert results[3]["value"] == 3.0
+        assert app.engine.variables == {"x": 1.0, "y": 3.0}
+    
+    def test_changed_first_line_runs_everything(self, app):
+        app.execute_incremental("x = 1\ny = x * 2")
+        results = app.execute_incremental("x = 4\ny = x * 2")
+        
+        assert [r["value"] for r in results] == [4.0, 8.0]
@@ -0,0 +1,57 @@
+"""Tests for fermi_kernels module"""
+import pytest
+import numpy as np
+
+numba = pytest.importorskip("numba")
+
+from fermi_kernels import ARRAY_KERNELS, compile_kernel, get_kernel
+
+
+class TestArrayKernels:
+    """Tests for the element-wise array kernels"""
+    
+    @pytest.mark.parametrize("op, expected", [
+        ("+", [5.0, 7.0, 9.0]),
+        ("-", [-3.0, -3.0, -3.0]),
+        ("*", [4.0, 10.0, 18.0]),
+        ("/", [0.25, 0.4, 0.5]),
+    ])
+    def test_kernel_matches_numpy(self, op, expected):
+        a = np.array([1.0, 2.0, 3.0])
+        b = np.array([4.0, 5.0, 6.0])
+        out = np.empty(3)
+        ARRAY_KERNELS[op](a, b, out)
+        assert np.allclose(out, expected)
+    
+    def test_kernel_in_place(self):
+        a = np.array([1.0, 2.0, 3.0])
+        b = np.array([4.0, 5.0, 6.0])
+        ARRAY_KERNELS["+"](a, b, a)
+        assert np.array_equal(a, [5.0, 7.0, 9.0])
+    
+    def test_division_by_zero_gives_inf(self):
+        out = np.empty(1)
+        ARRAY_KERNELS["/"](np.array([1.0]), np.array([0.0]), out)
+        assert np.isinf(out[0])
+
+
+class TestCompileKernel:
+    """Tests for compile_kernel function"""
+    
+    def test_fused_expression(self):
+        kernel = compile_kernel(["LEAF", "LEAF", "*", "LEAF", "+"], ("a", "s", "a"))
+        a = np.array([1.0, 2.0])
+        c = np.array([10.0, 20.0])
+        out = np.empty(2)
+        kernel(out, a, 3.0, c)
+        assert np.array_equal(out, [13.0, 26.0])
+    
+    def test_negate(self):
+        kernel = compile_kernel(["LEAF", "NEGATE"], ("a",))
+        out = np.empty(2)
+        kernel(out, np.array([1.0, -2.0]))
+        assert np.array_equal(out, [-1.0, 2.0])
+    
+    def test_get_kernel_is_shared(self):
+        structure = ("LEAF", "LEAF", "+")
+        assert get_kernel(structure, ("a", "s")) is get_kernel(structure, ("a", "s"))
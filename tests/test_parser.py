@@ -1,6 +1,6 @@
 """Tests for fermi_parser module"""
 import pytest
-from fermi_parser import parse_line, tokenize, ParseError
+from fermi_parser import EMPTY_LINE, parse_line, tokenize, tokenize_all, to_postfix, ParseError, TK
 
 
 class TestParseLine:
@@ -19,6 +19,15 @@ class TestParseLine:
         result = parse_line("   ")
         assert result["type"] == "empty"
     
+    def test_parse_blank_lines_share_one_result(self):
+        assert parse_line("") is EMPTY_LINE
+        assert parse_line(" \t ") is EMPTY_LINE
+    
+    def test_parse_indented_comment(self):
+        result = parse_line("   #  note  ")
+        assert result["type"] == "comment"
+        assert result["text"] == "  note"
+    
     def test_parse_simple_assignment(self):
         result = parse_line("x = 10")
         assert result["type"] == "assignment"
@@ -73,6 +82,20 @@ class TestParseLine:
     def test_parse_comparison_raises_error(self):
         with pytest.raises(ParseError):
             parse_line("x = y == 10")
+    
+    def test_parse_result_is_immutable(self):
+        result = parse_line("x = 10")
+        with pytest.raises(AttributeError):
+            result.var = "changed"
+        assert parse_line("x = 10").var == "x"
+    
+    def test_parse_result_supports_key_lookup(self):
+        result = parse_line("x = 10")
+        assert result.type == result["type"] == "assignment"
+        assert "expr" in result
+        assert "comment" not in result
+        with pytest.raises(KeyError):
+            result["comment"]
 
 
 class TestTokenize:
@@ -139,9 +162,19 @@ class TestTokenize:
         tokens = tokenize("my_var_name")
         assert tokens == [("VARIABLE", "my_var_name")]
     
+    def test_tokenize_suffix_and_trailing_dot(self):
+        # Only uppercase suffixes scale; a lowercase letter starts a name
+        assert tokenize("2.K") == [("NUMBER", 2000.0)]
+        assert tokenize("10k") == [("NUMBER", 10.0), ("VARIABLE", "k")]
+    
     def test_tokenize_invalid_token(self):
         with pytest.raises(ParseError):
             tokenize("x @ y")  # @ is not a valid operator
+    
+    def test_tokenize_returns_fresh_list(self):
+        tokens = tokenize("x * 2")
+        tokens.append(("NUMBER", 1.0))
+        assert tokenize("x * 2") == [("VARIABLE", "x"), ("OPERATOR", "*"), ("NUMBER", 2.0)]
 
 
 class TestTokenizeDistributions:
@@ -193,4 +226,121 @@ class TestTokenizeDistributions:
             ("VARIABLE", "x"),
             ("OPERATOR", "*"),
             ("UNIFORM", 2000000.0, 3000000.0)
-        ]
\ No newline at end of file
+        ]
+
+
+class TestTokenizeAll:
+    """Tests for tokenize_all function"""
+    
+    def test_tokenize_all_matches_tokenize(self):
+        lines = ["10 * 2", "x + 2.5K", "2M 3M", "(a - b) / c"]
+        assert tokenize_all("\n".join(lines)) == [tokenize(line) for line in lines]
+    
+    def test_tokenize_all_empty_line(self):
+        assert tokenize_all("10\n\n20") == [[("NUMBER", 10.0)], [], [("NUMBER", 20.0)]]
+    
+    def test_tokenize_all_uniform_does_not_span_lines(self):
+        assert tokenize_all("10\n20") == [[("NUMBER", 10.0)], [("NUMBER", 20.0)]]
+    
+    def test_tokenize_all_invalid_token(self):
+        with pytest.raises(ParseError):
+            tokenize_all("10\nx @ y")
+
+
+class TestToPostfix:
+    """Tests for to_postfix function"""
+    
+    def test_postfix_single_number(self):
+        assert to_postfix(tokenize("10")) == [("NUMBER", 10.0)]
+    
+    def test_postfix_precedence(self):
+        assert to_postfix(tokenize("x + y * 2")) == [
+            ("VARIABLE", "x"),
+            ("VARIABLE", "y"),
+            ("NUMBER", 2.0),
+            ("OPERATOR", "*"),
+            ("OPERATOR", "+")
+        ]
+    
+    def test_postfix_left_associative(self):
+        assert to_postfix(tokenize("a - b - c")) == [
+            ("VARIABLE", "a"),
+            ("VARIABLE", "b"),
+            ("OPERATOR", "-"),
+            ("VARIABLE", "c"),
+            ("OPERATOR", "-")
+        ]
+    
+    def test_postfix_parentheses(self):
+        assert to_postfix(tokenize("(x + y) * 2")) == [
+            ("VARIABLE", "x"),
+            ("VARIABLE", "y"),
+            ("OPERATOR", "+"),
+            ("NUMBER", 2.0),
+            ("OPERATOR", "*")
+        ]
+    
+    def test_postfix_folds_constants(self):
+        assert to_postfix(tokenize("(10 + 20) * 2")) == [("NUMBER", 60.0)]
+        assert to_postfix(tokenize("-(2 + 3) * x")) == [
+            ("NUMBER", -5.0),
+            ("VARIABLE", "x"),
+            ("OPERATOR", "*")
+        ]
+    
+    def test_postfix_does_not_fold_uniform(self):
+        assert to_postfix(tokenize("(2 + 3) * 10 20")) == [
+            ("NUMBER", 5.0),
+            ("UNIFORM", 10.0, 20.0),
+            ("OPERATOR", "*")
+        ]
+    
+    def test_postfix_does_not_fold_division_by_zero(self):
+        assert to_postfix(tokenize("1 / 0")) == [
+            ("NUMBER", 1.0),
+            ("NUMBER", 0.0),
+            ("OPERATOR", "/")
+        ]
+    
+    def test_postfix_unary_minus(self):
+        assert to_postfix(tokenize("-x * 2")) == [
+            ("VARIABLE", "x"),
+            ("NEGATE", "-"),
+            ("NUMBER", 2.0),
+            ("OPERATOR", "*")
+        ]
+    
+    def test_postfix_uniform(self):
+        assert to_postfix(tokenize("x * 2M 3M")) == [
+            ("VARIABLE", "x"),
+            ("UNIFORM", 2000000.0, 3000000.0),
+            ("OPERATOR", "*")
+        ]
+    
+    def test_postfix_missing_rparen_raises_error(self):
+        with pytest.raises(ParseError):
+            to_postfix(tokenize("(10 + 20"))
+    
+    def test_postfix_extra_rparen_raises_error(self):
+        with pytest.raises(ParseError):
+            to_postfix(tokenize("10 + 20)"))
+    
+    def test_postfix_trailing_operator_raises_error(self):
+        with pytest.raises(ParseError):
+            to_postfix(tokenize("10 +"))
+    
+    def test_postfix_adjacent_variables_raises_error(self):
+        with pytest.raises(ParseError):
+            to_postfix(tokenize("x y"))
+
+
+class TestTokenKinds:
+    """Tests for the TK token kind enum"""
+    
+    def test_every_token_type_has_a_kind(self):
+        token_types = {token[0] for token in tokenize("-(x + 2) * 3 4 / y")}
+        token_types |= {token[0] for token in to_postfix(tokenize("-x"))}
+        assert token_types <= set(TK.__members__)
+    
+    def test_kinds_are_dense_integers(self):
+        assert sorted(int(kind) for kind in TK) == list(range(len(TK)))